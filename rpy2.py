@@ -1,27 +1,40 @@
 # -*- coding: utf-8 -*-
 
 # --- Install necessary packages ---
-!pip install numpy pandas scipy scikit-learn statsmodels patsy matplotlib seaborn google-colab pyreadr rpy2 semopy
+!pip install numpy pandas scipy scikit-learn statsmodels patsy matplotlib seaborn google-colab pyreadr rpy2 semopy plotly-resampler==0.11.1 anywidget pyarrow
 # pyreadr and rpy2 are for calling R functions from Python
 # semopy for SEM analysis
+# plotly-resampler for downsampling large traces in the interactive plots (pinned: the explorer
+# clears its private _hf_data trace registry, which has no public equivalent)
+# anywidget is required by plotly>=6 for go.FigureWidget
+# pyarrow for the parquet data cache
 
 # --- Imports ---
 import numpy as np
 import pandas as pd
 from scipy import stats
-from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 import statsmodels.api as sm
 import statsmodels.formula.api as smf
-from patsy import dmatrices
+from patsy import dmatrices, build_design_matrices
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import seaborn as sns
-from google.colab import drive
+from google.colab import drive, output
 import os
-import random
-from collections import defaultdict
+import sys
+import hashlib
+import inspect
+import threading
+from functools import wraps, lru_cache
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import Counter, OrderedDict
 import plotly.graph_objects as go  # For interactive plots
-import plotly.express as px  # For easier interactive plots
+import plotly.io as pio
+from plotly_resampler import FigureWidgetResampler  # Sends only view-window samples of large traces
 import ipywidgets as widgets  # For interactive widgets
 from IPython.display import display, HTML, clear_output # For displaying in Jupyter/Colab
 
@@ -33,21 +46,151 @@ from rpy2.robjects.packages import importr
 # Activate pandas conversion for rpy2
 pandas2ri.activate()
 
-# Install the 'IPMA' R package (if not already installed)
-utils = importr('utils')
-try:
-    IPMA_r = importr('IPMA')  # Try importing; will raise an error if not installed
-except Exception as e:
-    print(f"Error importing IPMA R package: {e}. Attempting to install...")
-    utils.install_packages('IPMA', repos='https://cloud.r-project.org')
+# The 'IPMA' R package is loaded lazily on first use (see get_IPMA)
+_IPMA_r = None
+_IPMA_load_attempted = False  # Sentinel so a failed load/install is not retried on every call
+# R-side wrapper that runs IPMA over a list of formulas in a single rpy2 call
+_batch_IPMA_r = None
+
+def get_IPMA():
+    """Returns the 'IPMA' R package, importing it (and installing it if not
+    already installed) on first call. Returns None if it is unavailable.
+    """
+    global _IPMA_r, _IPMA_load_attempted, _batch_IPMA_r
+    if _IPMA_load_attempted:
+        return _IPMA_r
+    _IPMA_load_attempted = True
+
     try:
-        IPMA_r = importr('IPMA')  # Import after installation
-        print("IPMA R package successfully installed and imported.")
+        _IPMA_r = importr('IPMA')  # Try importing; will raise an error if not installed
     except Exception as e:
-        print(f"Failed to install and import IPMA R package: {e}. IPMA functionality will be limited.")
-        IPMA_r = None  # Set to None to avoid further errors
+        print(f"Error importing IPMA R package: {e}. Attempting to install...")
+        utils = importr('utils')
+        utils.install_packages('IPMA', repos='https://cloud.r-project.org')
+        try:
+            _IPMA_r = importr('IPMA')  # Import after installation
+            print("IPMA R package successfully installed and imported.")
+        except Exception as e:
+            print(f"Failed to install and import IPMA R package: {e}. IPMA functionality will be limited.")
+            return None
+
+    # Define the batch wrapper once the package is available, so calls skip any per-call lookup
+    _batch_IPMA_r = robjects.r(
+        'function(data, formulas) lapply(formulas, function(f) tryCatch(IPMA::IPMA(data, f), '
+        'error = function(e) { message("Error running IPMA in R: ", conditionMessage(e)); NULL }))'
+    )
+    return _IPMA_r
 
-def run_IPMA_in_r(data, x_columns, y_column):
+# Caches for run_IPMA_in_r: converted R data frames and raw IPMA results.
+# Keys are built from _columns_fingerprint(), so they follow the data's contents; least recently used entries are evicted.
+_R_CACHE_SIZE = 16
+_r_data_cache = OrderedDict()
+_IPMA_results_cache = OrderedDict()
+
+def _columns_fingerprint(data, columns):
+    """Returns a content hash of the given DataFrame columns, so cache entries never
+    outlive the data they were computed from (freed frames, in-place edits).
+    """
+    row_hashes = pd.util.hash_pandas_object(data[list(columns)], index=False).to_numpy()
+    return (tuple(columns), len(data), hashlib.sha1(row_hashes.tobytes()).hexdigest())
+
+def _cache_lookup(cache, key):
+    """Returns the cached value for key (marking it recently used), or None."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def _cache_store(cache, key, value, max_entries):
+    """Stores value under key, evicting the least recently used entries beyond max_entries."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
+_R_INT_MIN, _R_INT_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
+
+def _to_r_dataframe(data, columns):
+    """Builds an R data.frame from the selected columns via typed numpy arrays,
+    bypassing pandas2ri's generic per-column conversion.
+    """
+    r_columns = OrderedDict()
+    for col in columns:
+        series = data[col]
+        # R integers are 32-bit (INT_MIN is NA_integer_); missing or out-of-range integers go over as doubles
+        if (pd.api.types.is_integer_dtype(series) and not series.isna().any()
+                and (series.empty or (series.min() > _R_INT_MIN and series.max() <= _R_INT_MAX))):
+            r_columns[col] = robjects.IntVector(np.ascontiguousarray(series.to_numpy(), dtype=np.int32))
+        elif pd.api.types.is_numeric_dtype(series):
+            r_columns[col] = robjects.FloatVector(series.to_numpy(dtype=np.float64, na_value=np.nan))
+        else:
+            r_columns[col] = robjects.FactorVector(robjects.StrVector(series.astype(str).to_numpy()))
+    return robjects.DataFrame(r_columns)
+
+def run_IPMA_batch_in_r(data, selections, return_html=False, r_data=None):
+    """
+    Runs IPMA analysis for several (x_columns, y_column) selections using the
+    R 'IPMA' package, sending all uncached formulas to R in one call.
+
+    Args:
+        data (pd.DataFrame): The input data.
+        selections (list of tuples): [(x_columns, y_column), ...] to analyse.
+        return_html (bool): Return the bottleneck table as an HTML string
+            rendered in R instead of a pandas DataFrame.
+        r_data (robjects.DataFrame): Optional pre-converted R copy of data
+            containing the selected columns; skips the conversion step.
+
+    Returns:
+        list: One IPMA results dict per selection (empty dict if IPMA failed).
+    """
+    if get_IPMA() is None:
+        print("IPMA R package is not available. Skipping IPMA analysis.")
+        return [{} for _ in selections]
+
+    results_keys = [(_columns_fingerprint(data, [y_column] + list(x_columns)), y_column)
+                    for x_columns, y_column in selections]
+
+    # IPMA is deterministic, so previously seen selections reuse their R results
+    cached_results = {key: _cache_lookup(_IPMA_results_cache, key) for key in results_keys}
+    pending = OrderedDict()
+    for key, (x_columns, y_column) in zip(results_keys, selections):
+        if cached_results[key] is None:
+            pending[key] = (x_columns, y_column)
+
+    if pending and r_data is None:
+        # Convert only the needed columns to an R DataFrame (once per dataset and column set)
+        columns = list(OrderedDict.fromkeys(
+            col for x_columns, y_column in pending.values() for col in [y_column] + list(x_columns)
+        ))
+        r_data_key = _columns_fingerprint(data, columns)
+        r_data = _cache_lookup(_r_data_cache, r_data_key)
+        if r_data is None:
+            r_data = _to_r_dataframe(data, columns)
+            _cache_store(_r_data_cache, r_data_key, r_data, _R_CACHE_SIZE)
+
+    if pending:
+
+        # Construct the IPMA formula strings
+        formulas = [f"{y_column} ~ { '+'.join(x_columns) }" for x_columns, y_column in pending.values()]
+
+        # Run the IPMA analyses in R (failures come back as NULL)
+        try:
+            batch_results_r = _batch_IPMA_r(r_data, robjects.StrVector(formulas))
+        except Exception as e:
+            print(f"Error running IPMA in R: {e}")
+            return [{} for _ in selections]
+
+        for key, IPMA_results_r in zip(pending, batch_results_r):
+            if not isinstance(IPMA_results_r, robjects.rinterface.NULLType):
+                cached_results[key] = IPMA_results_r
+                _cache_store(_IPMA_results_cache, key, IPMA_results_r, _R_CACHE_SIZE)
+
+    return [
+        _extract_IPMA_results(cached_results[key], x_columns, return_html) if cached_results[key] is not None else {}
+        for key, (x_columns, _) in zip(results_keys, selections)
+    ]
+
+def run_IPMA_in_r(data, x_columns, y_column, return_html=False, r_data=None):
     """
     Runs IPMA analysis using the R 'IPMA' package via rpy2.
 
@@ -55,27 +198,36 @@ def run_IPMA_in_r(data, x_columns, y_column):
         data (pd.DataFrame): The input data.
         x_columns (list): List of X variable column names.
         y_column (str): The Y variable column name.
+        return_html (bool): Return the bottleneck table as an HTML string
+            rendered in R instead of a pandas DataFrame.
+        r_data (robjects.DataFrame): Optional pre-converted R copy of data
+            containing the selected columns; skips the conversion step.
 
     Returns:
         dict: A dictionary containing the IPMA results (effect sizes, bottleneck table, etc.).
     """
-    if IPMA_r is None:
-        print("IPMA R package is not available. Skipping IPMA analysis.")
-        return {}
-
-    # Convert the pandas DataFrame to an R DataFrame
-    r_data = pandas2ri.py2rpy(data)
+    return run_IPMA_batch_in_r(data, [(x_columns, y_column)], return_html, r_data)[0]
 
-    # Construct the IPMA formula string
-    formula_str = f"{y_column} ~ { '+'.join(x_columns) }"
+# R-side knitr::kable renderer for tables consumed only as HTML (created on first use)
+_kable_html_r = None
 
-    # Run the IPMA analysis in R
+def _r_table_to_html(table_r):
+    """Renders an R table directly to an HTML string with knitr::kable,
+    falling back to pandas conversion if knitr is not available.
+    """
+    global _kable_html_r
     try:
-        IPMA_results_r = IPMA_r.IPMA(r_data, formula_str)
+        if _kable_html_r is None:
+            _kable_html_r = robjects.r(
+                'function(x) paste(knitr::kable(x, format = "html", table.attr = \'class="bottleneck-table"\'), collapse = "\\n")'
+            )
+        return str(_kable_html_r(table_r)[0])
     except Exception as e:
-        print(f"Error running IPMA in R: {e}")
-        return {}
+        print(f"Warning: knitr::kable failed ({e}); converting the table via pandas instead.")
+        return pandas2ri.rpy2py(table_r).to_html(classes='bottleneck-table')
 
+def _extract_IPMA_results(IPMA_results_r, x_columns, return_html=False):
+    """Extracts effect sizes, bottleneck table and ceiling line from raw R IPMA results."""
     # Extract relevant results (effect sizes, bottleneck table, etc.)
     effect_sizes = {}
     for i, x_col in enumerate(x_columns):
@@ -86,12 +238,15 @@ def run_IPMA_in_r(data, x_columns, y_column):
             effect_sizes[x_col] = None # Handle cases where effect size isn't available
             print(f"Warning: Could not retrieve effect size for {x_col} using direct indexing.")
 
-    # Extract and convert the bottleneck table to a pandas DataFrame
+    # Extract and convert the bottleneck table to a pandas DataFrame (or HTML string)
     try:
         bottleneck_table_r = IPMA_results_r[6]  # Bottleneck table (adjust index if needed)
-        bottleneck_table_pd = pandas2ri.rpy2py(bottleneck_table_r)
+        if return_html:
+            bottleneck_table = _r_table_to_html(bottleneck_table_r)
+        else:
+            bottleneck_table = pandas2ri.rpy2py(bottleneck_table_r)
     except:
-        bottleneck_table_pd = None
+        bottleneck_table = None
         print("Warning: Could not retrieve bottleneck table using direct indexing.")
 
     # Extract ceiling coordinates for plotting
@@ -105,7 +260,7 @@ def run_IPMA_in_r(data, x_columns, y_column):
 
     return {
         "effect_sizes": effect_sizes,
-        "bottleneck_table": bottleneck_table_pd,
+        "bottleneck_table": bottleneck_table,
         "x_ceiling": x_ceiling,
         "y_ceiling": y_ceiling,
         "raw_r_results": IPMA_results_r  # Include the raw R results for debugging
@@ -146,6 +301,9 @@ def perform_sem_ipma(data, model_specification):
 # --- Mount Google Drive ---
 drive.mount('/content/drive')
 
+# --- Enable third-party widgets (plotly FigureWidget) in Colab ---
+output.enable_custom_widget_manager()
+
 # --- Define Output Directory ---
 output_dir = '/content/drive/MyDrive/data'  # Path to the 'data' folder
 os.makedirs(output_dir, exist_ok=True)  # Create the folder if it doesn't exist
@@ -181,6 +339,18 @@ def apply_minimalist_neon_theme():
     sns.set_style("darkgrid", {"axes.facecolor": "#000000", "grid.color": "#444444"})
     sns.set_palette(["#00FF00", "#00FFFF", "#FF00FF", "#FFFF00"])  # Neon palette
 
+# --- Neon Theme (for Plotly) ---
+# Registered once as the default template, so the interactive figures need no per-figure theme layout
+pio.templates['neon'] = go.layout.Template(layout=dict(
+    plot_bgcolor='#000000',
+    paper_bgcolor='#000000',
+    font=dict(color='#00FFFF'),
+    colorway=['#00FFFF'],
+    xaxis=dict(gridcolor='#444444', zerolinecolor='#444444'),
+    yaxis=dict(gridcolor='#444444', zerolinecolor='#444444'),
+))
+pio.templates.default = 'neon'
+
 
 # --- Data Simulation ---
 def simulate_data(n_participants=40, seed=42):
@@ -219,27 +389,28 @@ def simulate_data(n_participants=40, seed=42):
     errors_identified = np.random.randint(5, 20, size=n_participants)
     completion_time = np.random.uniform(180, 400, size=n_participants)
 
-    # Adjust based on group (simulated effects)
-    for i in range(n_participants):
-        if llm_usage[i] == 1:
-            final_self_efficacy[i] += 0.5
-            final_anxiety[i] -= 0.4
-            errors_identified[i] += 3
-            completion_time[i] -= 15
-        if herbal_blend[i] == 1:
-            final_anxiety[i] -= 0.3
-            errors_identified[i] += 1
-
-    # Ensure reasonable bounds
-    final_self_efficacy = np.clip(final_self_efficacy, 1, 5)
-    final_anxiety = np.clip(final_anxiety, 1, 4)
-    errors_identified = np.maximum(0, errors_identified)
-    completion_time = np.maximum(60, completion_time)
+    # Adjust based on group (simulated effects, vectorized over the 0/1 group arrays)
+    final_self_efficacy += 0.5 * llm_usage
+    final_anxiety -= 0.4 * llm_usage + 0.3 * herbal_blend
+    errors_identified += 3 * llm_usage + herbal_blend
+    completion_time -= 15 * llm_usage
+
+    # Ensure reasonable bounds (in place, no new arrays)
+    np.clip(final_self_efficacy, 1, 5, out=final_self_efficacy)
+    np.clip(final_anxiety, 1, 4, out=final_anxiety)
+    np.maximum(errors_identified, 0, out=errors_identified)
+    np.maximum(completion_time, 60, out=completion_time)
 
     # Combine ErrorsIdentified and CompletionTime into a single 'Performance' variable
     #  This is a simplification; a more sophisticated approach might involve standardization
     #  or a weighted average.
-    performance = (errors_identified + (500 - completion_time)/10) / 2 # Scale completion time to be positive and comparable
+    # Computed in place in a single buffer: (errors + (500 - time) / 10) / 2
+    # (scales completion time to be positive and comparable)
+    performance = np.empty(n_participants, dtype=np.float64)
+    np.subtract(500.0, completion_time, out=performance)
+    performance *= 0.1
+    performance += errors_identified
+    performance *= 0.5
 
     # Neurophysiological Data (simplified)
     eeg_alpha = np.random.normal(10, 2, size=n_participants)
@@ -251,15 +422,12 @@ def simulate_data(n_participants=40, seed=42):
     pog_pupil_diameter = np.random.normal(3.5, 0.5, size=n_participants)
     pog_blink_rate = np.random.uniform(10, 30, size=n_participants)
 
-    # Adjust based on group (simulated effects)
-    for i in range(n_participants):
-        if llm_usage[i] == 1:
-            eeg_beta[i] += 2
-            pog_fixations[i] -= 5
-            pog_fixation_duration[i] += 50
-        if herbal_blend[i] == 1:
-            ecg_hr[i] -= 5
-            eda_scr[i] -= 0.1
+    # Adjust based on group (simulated effects, vectorized over the 0/1 group arrays)
+    eeg_beta += 2 * llm_usage
+    pog_fixations -= 5 * llm_usage
+    pog_fixation_duration += 50 * llm_usage
+    ecg_hr -= 5 * herbal_blend
+    eda_scr -= 0.1 * herbal_blend
 
     # Create DataFrame
     data = pd.DataFrame({
@@ -292,6 +460,7 @@ def simulate_data(n_participants=40, seed=42):
 def preprocess_data(data):
     """Preprocesses data: one-hot encodes categoricals and scales numericals.
     Splitting into training and testing sets is now done within the SEM analysis.
+    Works on numpy arrays directly and assembles the result DataFrame once.
 
     Args:
         data (pd.DataFrame): The raw data.
@@ -300,15 +469,62 @@ def preprocess_data(data):
         pd.DataFrame: Preprocessed data.
     """
 
+    categorical_columns = ['Gender', 'ProgrammingExperience']
     features = data.drop(columns=['ParticipantID', 'ErrorsIdentified', 'CompletionTime', 'Performance'])
-    performance = data[['Performance']] # Use the combined performance measure
-    features = pd.get_dummies(features, columns=['Gender', 'ProgrammingExperience'])
-    numerical_features = features.select_dtypes(include=np.number).columns
-    scaler = StandardScaler()
-    features[numerical_features] = scaler.fit_transform(features[numerical_features])
-    processed_data = pd.concat([features, performance], axis=1) # Combine features and performance
+    numerical_features = [col for col in features.columns
+                          if col not in categorical_columns and features[col].dtype.kind in 'iuf']
+
+    # Standardize all numerical columns in one pass (population std, as StandardScaler)
+    X_num = features[numerical_features].to_numpy(dtype=np.float64)
+    mu = X_num.mean(axis=0)
+    sigma = X_num.std(axis=0)
+    sigma[sigma == 0] = 1.0  # Leave constant columns centred but unscaled
+    X_num -= mu
+    X_num /= sigma
+    scaled = dict(zip(numerical_features, X_num.T))
+
+    columns = {}
+    for col in features.columns:
+        if col in scaled:
+            columns[col] = scaled[col]
+        elif col not in categorical_columns:
+            columns[col] = features[col].to_numpy()
+
+    # One-hot encode categoricals from their category codes (same naming/order as pd.get_dummies)
+    for col in categorical_columns:
+        categorical = pd.Categorical(features[col])
+        one_hot = categorical.codes[:, None] == np.arange(len(categorical.categories))
+        for j, category in enumerate(categorical.categories):
+            columns[f"{col}_{category}"] = one_hot[:, j]
+
+    columns['Performance'] = data['Performance'].to_numpy() # Use the combined performance measure
+    processed_data = pd.DataFrame(columns, index=data.index)
     return processed_data
 
+# --- Data Caching ---
+def load_or_build_parquet(name, build, *functions):
+    """Loads a DataFrame cached as parquet in output_dir, or builds and caches it.
+
+    The cache file is keyed by a hash of the given functions' source code, so editing
+    any of them regenerates the data on the next run.
+
+    Args:
+        name (str): Cache file prefix.
+        build (callable): Zero-argument function returning the DataFrame.
+        *functions: Functions whose source the cached output depends on.
+
+    Returns:
+        pd.DataFrame: The cached or freshly built DataFrame.
+    """
+    source = ''.join(inspect.getsource(function) for function in functions)
+    signature = hashlib.sha1(source.encode()).hexdigest()[:12]
+    cache_file = os.path.join(output_dir, f"{name}_{signature}.parquet")
+    if os.path.exists(cache_file):
+        return pd.read_parquet(cache_file)
+    frame = build()
+    frame.to_parquet(cache_file)
+    return frame
+
 # --- Statistical Analyses ---
 def perform_statistical_analysis(data):
     """Performs descriptive stats, correlations, and group comparisons (t-tests).
@@ -325,14 +541,17 @@ def perform_statistical_analysis(data):
         'FinalSelfEfficacy', 'FinalAnxiety', 'Performance' # Use combined performance
     ]].corr()
     group_comparison_results = {}
+    llm_mask = data['LLMUsage'].to_numpy() == 1  # Computed once, reused for every variable
     for variable in ['FinalSelfEfficacy', 'FinalAnxiety', 'Performance']: # Use combined performance
-        llm_group = data[data['LLMUsage'] == 1][variable]
-        no_llm_group = data[data['LLMUsage'] == 0][variable]
-        t_stat, p_val = stats.ttest_ind(llm_group, no_llm_group)
+        values = data[variable].to_numpy()
+        t_stat, p_val = stats.ttest_ind(values[llm_mask], values[~llm_mask])
         group_comparison_results[variable] = {'t-statistic': t_stat, 'p-value': p_val}
     return descriptive_stats, correlation_matrix, group_comparison_results
 
 
+# Patsy design infos keyed by (formula, column dtypes), so repeated regressions skip formula parsing
+_design_info_cache = {}
+
 def perform_regression_analysis(data, dependent_variable='Performance'): # Use combined performance
     """Performs regression analysis using statsmodels on the entire dataset.
 
@@ -345,51 +564,93 @@ def perform_regression_analysis(data, dependent_variable='Performance'): # Use c
     """
 
     formula = f"{dependent_variable} ~ LLMUsage + HerbalBlend + InitialSelfEfficacy + InitialAnxiety"
-    y, X = dmatrices(formula, data=data, return_type='dataframe')
+    cache_key = (formula, tuple((col, str(dtype)) for col, dtype in data.dtypes.items()))
+    design_infos = _design_info_cache.get(cache_key)
+    if design_infos is None:
+        y, X = dmatrices(formula, data=data, return_type='dataframe')
+        _design_info_cache[cache_key] = (y.design_info, X.design_info)
+    else:
+        y, X = build_design_matrices(design_infos, data, return_type='dataframe')
     X = sm.add_constant(X)
     model = sm.OLS(y, X)
     results = model.fit()
     return results
 
 # --- Qualitative Analysis ---
-def analyze_prompts(data):
-    """Simulates prompt analysis, generating more realistic prompt data
-    based on LLM usage and then analyzing it.  Handles potential
-    ZeroDivisionError.
+# Common words ignored when counting prompt keywords
+_STOPWORDS = frozenset({
+    "i", "this", "the", "a", "in", "on", "can", "you", "me", "what", "how",
+    "is", "do", "does", "an", "here", "fix",
+})
+
+# Simulated prompt templates for LLM users (debug, explain, optimize) and non-LLM users
+_LLM_PROMPT_TEMPLATES = (
+    "P{}: Find the error in this code: `x = 10; y = 0; z = x / y`",
+    "P{}: Explain what this function does: `def add(a, b): return a + b`",
+    "P{}: How can I make this code faster: `for i in range(1000000): pass`",
+)
+_NO_LLM_PROMPT_TEMPLATE = "P{}: I'm stuck on this task, can you give me a hint?"
+
+# Simulated interview feedback for participants with and without LLM support (same number of options each)
+_LLM_FEEDBACK = (
+    "The LLM helped me find the bug quickly.",
+    "I understood the code better with the LLM's explanation.",
+    "The LLM gave me suggestions I wouldn't have thought of.",
+)
+_NO_LLM_FEEDBACK = (
+    "I wish I had a tool to help me understand the code.",
+    "I spent a lot of time trying to find the error myself.",
+    "It was difficult to debug without assistance.",
+)
+
+def _generate_prompts(data):
+    """Generates one simulated prompt per participant based on LLM usage.
 
     Args:
         data (pd.DataFrame): The dataset.
 
     Returns:
-        dict: Analysis results, including generated prompts.
+        list: The generated prompt strings.
     """
+    llm_usage = data['LLMUsage'].to_numpy()
+    prompt_types = np.random.randint(0, len(_LLM_PROMPT_TEMPLATES), size=len(data))  # Draw all prompt types at once
     prompts = []
     for i in range(len(data)):
-        if data['LLMUsage'][i] == 1:
+        if llm_usage[i] == 1:
             # Simulate more specific prompts for LLM users
-            prompt_type = random.choice(["debug", "explain", "optimize"])
-            if prompt_type == "debug":
-                prompts.append(f"P{i+1}: Find the error in this code: `x = 10; y = 0; z = x / y`")
-            elif prompt_type == "explain":
-                prompts.append(f"P{i+1}: Explain what this function does: `def add(a, b): return a + b`")
-            else:  # optimize
-                prompts.append(f"P{i+1}: How can I make this code faster: `for i in range(1000000): pass`")
+            prompts.append(_LLM_PROMPT_TEMPLATES[prompt_types[i]].format(i + 1))
         else:
             # Simulate more general questions for non-LLM users
-            prompts.append(f"P{i+1}: I'm stuck on this task, can you give me a hint?")
+            prompts.append(_NO_LLM_PROMPT_TEMPLATE.format(i + 1))
+    return prompts
+
+def _average_prompt_length(prompts):
+    """Returns the mean word count of the prompts (0 if there are none).
+    Word counts are taken from the single-spaced templates as spaces + 1.
+    """
+    lengths = np.fromiter((p.count(' ') + 1 for p in prompts), dtype=np.int32, count=len(prompts))
+    # Handle potential ZeroDivisionError if there are no prompts
+    return lengths.mean() if lengths.size else 0
+
+def analyze_prompts(data):
+    """Simulates prompt analysis, generating more realistic prompt data
+    based on LLM usage and then analyzing it.  Handles potential
+    ZeroDivisionError.
+
+    Args:
+        data (pd.DataFrame): The dataset.
+
+    Returns:
+        dict: Analysis results, including generated prompts.
+    """
+    prompts = _generate_prompts(data)
 
     # Analyze the generated prompts
-    prompt_lengths = [len(p.split()) for p in prompts]
-    # Handle potential ZeroDivisionError if prompt_lengths is empty
-    average_prompt_length = np.mean(prompt_lengths) if prompt_lengths else 0
+    average_prompt_length = _average_prompt_length(prompts)
 
     # Count keywords (more robustly)
-    keyword_counts = defaultdict(int)
-    for p in prompts:
-        for word in p.lower().split():
-            if word not in ["i", "this", "the", "a", "in", "on", "can", "you", "me", "what", "how", "is", "do", "does", "an", "here", "fix"]: # Common words
-                keyword_counts[word] += 1
-    most_common_keywords = sorted(keyword_counts.items(), key=lambda item: item[1], reverse=True)[:5]
+    keyword_counts = Counter(word for p in prompts for word in p.lower().split() if word not in _STOPWORDS)
+    most_common_keywords = keyword_counts.most_common(5)
 
 
     prompt_analysis = {
@@ -410,26 +671,22 @@ def analyze_interviews(data):
     Returns:
         dict: Analysis results, including generated feedback.
     """
+    llm_usage = data['LLMUsage'].to_numpy()
+    feedback_choices = np.random.randint(0, len(_LLM_FEEDBACK), size=len(data))  # Draw all feedback indices at once
     qualitative_feedback = []
     for i in range(len(data)):
-        if data['LLMUsage'][i] == 1:
-            feedback = random.choice([
-                "The LLM helped me find the bug quickly.",
-                "I understood the code better with the LLM's explanation.",
-                "The LLM gave me suggestions I wouldn't have thought of."
-            ])
+        if llm_usage[i] == 1:
+            feedback = _LLM_FEEDBACK[feedback_choices[i]]
         else:
-            feedback = random.choice([
-                "I wish I had a tool to help me understand the code.",
-                "I spent a lot of time trying to find the error myself.",
-                "It was difficult to debug without assistance."
-            ])
+            feedback = _NO_LLM_FEEDBACK[feedback_choices[i]]
         qualitative_feedback.append(f"P{i+1}: {feedback}")
 
+    has_llm = bool(llm_usage.any())
+    has_herbal = bool(data['HerbalBlend'].to_numpy().any())
     interview_analysis = {
-        "perceived_usefulness_llm": np.random.uniform(3, 5) if data['LLMUsage'].any() else np.random.uniform(1, 3),
-        "anxiety_reduction_llm": np.random.uniform(1, 3) if data['LLMUsage'].any() else np.random.uniform(0, 1),
-        "anxiety_reduction_herbal": np.random.uniform(1, 3) if data['HerbalBlend'].any() else np.random.uniform(0, 1),
+        "perceived_usefulness_llm": np.random.uniform(3, 5) if has_llm else np.random.uniform(1, 3),
+        "anxiety_reduction_llm": np.random.uniform(1, 3) if has_llm else np.random.uniform(0, 1),
+        "anxiety_reduction_herbal": np.random.uniform(1, 3) if has_herbal else np.random.uniform(0, 1),
         "qualitative_feedback": qualitative_feedback,  # Include generated feedback
     }
     return interview_analysis
@@ -478,46 +735,185 @@ def create_sem_diagram_mpl(model_name, nodes, edges, filename):
 
 
 # --- Statistical Plotting Functions (Matplotlib/Seaborn) ---
+# Shared Agg figure for batch PNG exports, reused across calls to bypass pyplot's figure manager
+_FIG = Figure()
+_CANVAS = FigureCanvasAgg(_FIG)
+
+# KDE grids keyed by the plotted columns' contents and plot kind, reused across repeated plots (LRU-bounded)
+_KDE_CACHE_SIZE = 32
+_kde_cache = OrderedDict()
+
+def _reset_shared_axes(figsize):
+    """Clears the shared Agg figure and returns a fresh axes of the given size."""
+    _FIG.clf()
+    _FIG.set_size_inches(*figsize)
+    _FIG.set_facecolor(plt.rcParams['figure.facecolor'])  # Pick up the theme applied after import
+    return _FIG.add_subplot(111)
+
 def create_histogram_mpl(data, column, filename):
     """Creates a histogram with the neon theme (Matplotlib)."""
-    plt.figure(figsize=(8, 6))
-    # Use plt.hist for more control, no fill
-    n, bins, patches = plt.hist(data[column], edgecolor='#00FFFF', facecolor='none', linewidth=2)
-    plt.title(f"Histogram of {column}", color='#00FFFF') # Explicitly set title color
-    plt.xlabel(column, color='#00FFFF') # Explicitly set label colors
-    plt.ylabel("Frequency", color='#00FFFF')
-    plt.savefig(filename)
-    plt.close()
+    ax = _reset_shared_axes((8, 6))
+    # Use ax.hist for more control, no fill
+    n, bins, patches = ax.hist(data[column], edgecolor='#00FFFF', facecolor='none', linewidth=2)
+    ax.set_title(f"Histogram of {column}", color='#00FFFF') # Explicitly set title color
+    ax.set_xlabel(column, color='#00FFFF') # Explicitly set label colors
+    ax.set_ylabel("Frequency", color='#00FFFF')
+    _FIG.savefig(filename)
     print(f"Histogram saved to: {filename}")
 
+def _kde_1d(values, gridsize=200, cut=2):
+    """Evaluates a Gaussian KDE of values on an even grid extending cut
+    bandwidths past the data. Returns (grid, density), or None for empty or
+    constant data. Callers drop non-finite values first.
+    """
+    if values.size == 0 or np.ptp(values) == 0:
+        return None
+    kernel = stats.gaussian_kde(values)
+    bw = kernel.factor * values.std(ddof=1)
+    grid = np.linspace(values.min() - cut * bw, values.max() + cut * bw, gridsize)
+    return grid, kernel(grid)
+
+def _kde_2d(x, y, gridsize=100, cut=3):
+    """Evaluates a 2D Gaussian KDE on a gridsize x gridsize mesh extending cut
+    bandwidths past the data. Returns the (X, Y, Z) grids.
+    """
+    kernel = stats.gaussian_kde(np.vstack([x, y]))
+    bw_x = kernel.factor * x.std(ddof=1)
+    bw_y = kernel.factor * y.std(ddof=1)
+    X, Y = np.meshgrid(np.linspace(x.min() - cut * bw_x, x.max() + cut * bw_x, gridsize),
+                       np.linspace(y.min() - cut * bw_y, y.max() + cut * bw_y, gridsize))
+    Z = np.reshape(kernel(np.vstack([X.ravel(), Y.ravel()])), X.shape)
+    return X, Y, Z
+
+def _violin_densities(data, x_column, y_column):
+    """Returns [(group, kde), ...] for y_column grouped by x_column, cached per dataset."""
+    return _violin_densities_many(data, x_column, [y_column])[y_column]
+
+def _violin_densities_many(data, x_column, y_columns):
+    """Returns {y_column: [(group, kde), ...]} for several y columns grouped by x_column,
+    filling the cache for all of them from a single groupby pass.
+    """
+    keys = {y: (_columns_fingerprint(data, [x_column, y]), 'violin') for y in y_columns}
+    densities = {y: _cache_lookup(_kde_cache, key) for y, key in keys.items()}
+    missing = [y for y, cached in densities.items() if cached is None]
+    if missing:
+        for y in missing:
+            densities[y] = []
+        for group, frame in data.groupby(x_column)[missing]:
+            for y in missing:
+                values = frame[y].to_numpy(dtype=np.float64)
+                densities[y].append((group, _kde_1d(values[np.isfinite(values)])))  # Skip NaN/inf like seaborn
+        for y in missing:
+            _cache_store(_kde_cache, keys[y], densities[y], _KDE_CACHE_SIZE)
+    return densities
+
+def _draw_violin(ax, data, x_column, y_column, densities):
+    """Draws violins from precomputed densities onto ax (no fill, cyan outline)."""
+    max_density = max((kde[1].max() for _, kde in densities if kde is not None), default=1.0)
+    # Each violin is a mirrored KDE outline, widths scaled by a shared density
+    for position, (group, kde) in enumerate(densities):
+        if kde is None:  # Constant (or empty) group: nothing to estimate, mark its value
+            values = data.loc[data[x_column] == group, y_column].dropna()
+            if not values.empty:
+                ax.hlines(values.iloc[0], position - 0.4, position + 0.4, color='#00FFFF', linewidth=2)
+            continue
+        grid, density = kde
+        half_width = 0.4 * density / max_density
+        ax.fill_betweenx(grid, position - half_width, position + half_width,
+                         facecolor='none', edgecolor='#00FFFF', linewidth=2)
+    ax.set_xticks(range(len(densities)))
+    ax.set_xticklabels([group for group, _ in densities])
+    ax.set_title(f"Violin Plot of {y_column} by {x_column}", color='#00FFFF')
+    ax.set_xlabel(x_column, color='#00FFFF')
+    ax.set_ylabel(y_column)
+
 def create_violin_plot_mpl(data, x_column, y_column, filename):
-    """Creates a violin plot with the neon theme (Matplotlib/Seaborn)."""
-    plt.figure(figsize=(8, 6))
-    # Use Seaborn, but customize to remove fill
-    sns.violinplot(x=data[x_column], y=data[y_column], color='#00FFFF', linewidth=2, inner=None) # No fill, cyan outline
-    plt.title(f"Violin Plot of {y_column} by {x_column}", color='#00FFFF')
-    plt.xlabel(x_column, color='#00FFFF')
-    plt.ylabel(y_column)
-    plt.savefig(filename)
-    plt.close()
+    """Creates a violin plot with the neon theme (Matplotlib)."""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    _draw_violin(ax, data, x_column, y_column, _violin_densities(data, x_column, y_column))
+    fig.savefig(filename)
+    plt.close(fig)
     print(f"Violin plot saved to: {filename}")
 
+def create_violin_grid_mpl(data, specs, filename, ncols=3):
+    """Creates several violin plots as panels of one figure (Matplotlib).
+
+    Args:
+        data (pd.DataFrame): Data containing all the plotted columns.
+        specs (list of tuples): [(x_column, y_column), ...], one panel each.
+        filename (str): Output PNG path.
+        ncols (int): Panels per row.
+    """
+    # One groupby pass per grouping column covers all of its panels
+    y_columns_by_x = {}
+    for x_column, y_column in specs:
+        y_columns_by_x.setdefault(x_column, []).append(y_column)
+    densities = {x_column: _violin_densities_many(data, x_column, y_columns)
+                 for x_column, y_columns in y_columns_by_x.items()}
+
+    nrows = -(-len(specs) // ncols)
+    fig, axes = plt.subplots(nrows, ncols, figsize=(6 * ncols, 5 * nrows), squeeze=False)
+    for ax, (x_column, y_column) in zip(axes.flat, specs):
+        _draw_violin(ax, data, x_column, y_column, densities[x_column][y_column])
+    for ax in axes.flat[len(specs):]:  # Hide unused panels
+        ax.set_visible(False)
+    fig.tight_layout()
+    fig.savefig(filename, dpi=120)
+    plt.close(fig)
+    print(f"Violin plots saved to: {filename}")
+
+def _kde_2d_grid(data, column1, column2):
+    """Returns the (X, Y, Z) KDE grids of column1 vs. column2, cached per dataset."""
+    key = (_columns_fingerprint(data, [column1, column2]), 'kde2d')
+    grids = _cache_lookup(_kde_cache, key)
+    if grids is None:
+        x = data[column1].to_numpy(dtype=np.float64)
+        y = data[column2].to_numpy(dtype=np.float64)
+        finite = np.isfinite(x) & np.isfinite(y)  # Use only rows where both values are present, like seaborn
+        grids = _kde_2d(x[finite], y[finite])
+        _cache_store(_kde_cache, key, grids, _KDE_CACHE_SIZE)
+    return grids
+
 def create_kde_plot_mpl(data, column1, column2, filename):
-    """Creates a 2D KDE plot with the neon theme (Matplotlib/Seaborn)."""
-    plt.figure(figsize=(8, 6))
-    # Use Seaborn, but plot only the contours, no fill
-    sns.kdeplot(x=data[column1], y=data[column2], color='#00FFFF', linewidths=2, thresh=0, levels=10) # Only contour lines
-    plt.title(f"KDE Plot of {column1} vs. {column2}", color='#00FFFF')
-    plt.xlabel(column1, color='#00FFFF')
-    plt.ylabel(column2)
-    plt.savefig(filename)
-    plt.close()
+    """Creates a 2D KDE plot with the neon theme (Matplotlib)."""
+    X, Y, Z = _kde_2d_grid(data, column1, column2)
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    # Plot only the contours, no fill
+    ax.contour(X, Y, Z, levels=10, colors='#00FFFF', linewidths=2)
+    ax.set_title(f"KDE Plot of {column1} vs. {column2}", color='#00FFFF')
+    ax.set_xlabel(column1, color='#00FFFF')
+    ax.set_ylabel(column2)
+    fig.savefig(filename)
+    plt.close(fig)
     print(f"KDE plot saved to: {filename}")
 
+def _group_means(data, row_column, col_column, value_column):
+    """Mean of value_column per (row_column, col_column) pair as a 2D table,
+    equivalent to groupby([row, col]).mean().unstack() but computed with a
+    single bincount pass over factorized codes.
+    """
+    # groupby drops rows with a NaN key before forming groups, so categories come from the keyed rows only
+    keyed = data[row_column].notna().to_numpy() & data[col_column].notna().to_numpy()
+    row_codes, row_cats = pd.factorize(data[row_column][keyed], sort=True)
+    col_codes, col_cats = pd.factorize(data[col_column][keyed], sort=True)
+    values = data[value_column].to_numpy(dtype=np.float64)[keyed]
+    valid = ~np.isnan(values)  # NaN values are skipped by mean()
+
+    n_cells = len(row_cats) * len(col_cats)
+    flat = row_codes[valid] * len(col_cats) + col_codes[valid]
+    sums = np.bincount(flat, weights=values[valid], minlength=n_cells)
+    counts = np.bincount(flat, minlength=n_cells)
+    means = np.divide(sums, counts, out=np.full(n_cells, np.nan), where=counts > 0)
+
+    return pd.DataFrame(means.reshape(len(row_cats), len(col_cats)),
+                        index=pd.Index(row_cats, name=row_column),
+                        columns=pd.Index(col_cats, name=col_column))
+
 def create_stacked_bar_plot_mpl(data, x_column, y_column, color_column, filename):
     """Creates a stacked bar plot (Matplotlib/Seaborn)."""
     plt.figure(figsize=(8, 6))
-    pivot_data = data.groupby([x_column, color_column])[y_column].mean().unstack()
+    pivot_data = _group_means(data, x_column, color_column, y_column)
     # Plot with no fill, only outlines
     pivot_data.plot(kind='bar', stacked=True, edgecolor='#00FFFF', linewidth=2, ax=plt.gca(), legend=False)
     plt.title(f"Stacked Bar Plot of {y_column} by {x_column} and {color_column}", color='#00FFFF')
@@ -535,15 +931,61 @@ def create_heatmap(data, filename):
         print("Not enough numeric columns to create a heatmap.")
         return
 
-    plt.figure(figsize=(10, 8))
-    # Use Seaborn, customize colormap and lines
-    sns.heatmap(data_numeric.corr(), annot=True, cmap=sns.color_palette("coolwarm", as_cmap=True), fmt=".2f",
-                linewidths=.5, linecolor='#00FFFF', cbar=False, annot_kws={"color": "#00FF00"}) # No colorbar
-    plt.title("Correlation Heatmap")
-    plt.savefig(filename, bbox_inches='tight', transparent=True)
-    plt.close()
+    corr = data_numeric.corr()
+    corr_values = corr.to_numpy()
+    n_vars = corr_values.shape[0]
+
+    ax = _reset_shared_axes((10, 8))
+    # Draw the matrix directly with imshow (no colorbar), annotating each cell
+    ax.imshow(corr_values, cmap='coolwarm', vmin=-1, vmax=1)
+    ax.set_xticks(np.arange(n_vars))
+    ax.set_xticklabels(corr.columns, rotation=45, ha='right')
+    ax.set_yticks(np.arange(n_vars))
+    ax.set_yticklabels(corr.index)
+    # Cyan cell borders via minor-tick grid lines
+    ax.grid(False)
+    ax.set_xticks(np.arange(n_vars + 1) - 0.5, minor=True)
+    ax.set_yticks(np.arange(n_vars + 1) - 0.5, minor=True)
+    ax.grid(which='minor', color='#00FFFF', linewidth=.5)
+    ax.tick_params(which='minor', length=0)
+    for i, j in np.ndindex(corr_values.shape):
+        ax.text(j, i, f"{corr_values[i, j]:.2f}", ha='center', va='center', color='#00FF00', fontsize=8)
+    ax.set_title("Correlation Heatmap")
+    _FIG.savefig(filename, bbox_inches='tight', transparent=True)
     print(f"Heatmap saved to: {filename}")
 
+def _describe_numeric(data_numeric):
+    """Computes the DataFrame.describe() statistics (count, mean, std, min,
+    quartiles, max) per numeric column, using np.partition for the quartiles
+    instead of a full sort.
+
+    Args:
+        data_numeric (pd.DataFrame): Numeric columns only.
+
+    Returns:
+        pd.DataFrame: One row per column, same layout as describe().transpose().
+    """
+    quantiles = (0.25, 0.5, 0.75)
+    rows = []
+    for col in data_numeric.columns:
+        arr = data_numeric[col].to_numpy(dtype=np.float64)
+        arr = arr[~np.isnan(arr)]
+        n = arr.size
+        if n == 0:
+            rows.append([0] + [np.nan] * 7)
+            continue
+
+        # Linear-interpolated quantiles (as pandas) from the partitioned neighbours
+        positions = [q * (n - 1) for q in quantiles]
+        bounds = [(int(np.floor(pos)), int(np.ceil(pos))) for pos in positions]
+        part = np.partition(arr, sorted({k for pair in bounds for k in pair}))
+        quartiles = [part[lo] + (part[hi] - part[lo]) * (pos - lo) for pos, (lo, hi) in zip(positions, bounds)]
+        std = arr.std(ddof=1) if n > 1 else np.nan
+        rows.append([n, arr.mean(), std, arr.min(), *quartiles, arr.max()])
+
+    return pd.DataFrame(rows, index=data_numeric.columns,
+                        columns=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'], dtype=np.float64)
+
 def generate_summary_html(data, filename="summary_statistics.html"):
     """Generates descriptive statistics and saves them as an HTML file."""
     if data.empty:
@@ -554,7 +996,7 @@ def generate_summary_html(data, filename="summary_statistics.html"):
     data_numeric = data.select_dtypes(include=np.number)
 
     # Generate descriptive statistics
-    summary_stats = data_numeric.describe().transpose()
+    summary_stats = _describe_numeric(data_numeric)
 
     # Save to HTML
     summary_html = summary_stats.to_html(classes='table table-dark', border=0)
@@ -566,8 +1008,97 @@ def generate_summary_html(data, filename="summary_statistics.html"):
 
     print(f"Summary statistics saved to {filename}")
 
+# --- Batch Plot Export ---
+def _run_plot_job(job):
+    """Runs a single (plot_function, args) job; module-level so it can be pickled."""
+    plot_function, args = job
+    plot_function(*args)
+
+def export_plots_parallel(jobs, max_workers=None):
+    """Renders independent Matplotlib (Agg) PNG exports in parallel worker processes.
+
+    The pool is only used when running as a script with fork available: a
+    notebook kernel is multi-threaded (and embeds R), where forking can
+    deadlock, and spawn/forkserver workers cannot unpickle functions defined
+    in a notebook's __main__. Otherwise the jobs are rendered serially, as are
+    any jobs that did not complete in the pool.
+
+    Args:
+        jobs (list of tuples): [(plot_function, args), ...]. Pass only the data
+            columns each job needs to keep the pickled payload small.
+        max_workers (int): Number of worker processes (defaults to the CPU count).
+    """
+    completed = [False] * len(jobs)
+    running_as_script = hasattr(sys.modules['__main__'], '__file__')
+    if len(jobs) > 1 and running_as_script and 'fork' in multiprocessing.get_all_start_methods():
+        errors = []
+        try:
+            # Workers re-apply the theme so every export uses it
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                     mp_context=multiprocessing.get_context('fork'),
+                                     initializer=apply_minimalist_neon_theme) as executor:
+                futures = [executor.submit(_run_plot_job, job) for job in jobs]
+                for i, future in enumerate(futures):
+                    try:
+                        future.result()
+                        completed[i] = True
+                    except Exception as e:  # Pickling errors, broken pool, or a failing job
+                        errors.append(e)
+        except (BrokenProcessPool, OSError) as e:
+            errors.append(e)
+        if errors:
+            print(f"Warning: parallel plot export failed ({errors[0]}); rendering the remaining plots serially.")
+    for job, done in zip(jobs, completed):
+        if not done:
+            _run_plot_job(job)
+
 # --- Interactive Visualization with Plotly and ipywidgets ---
 
+def debounce(wait, on_error=None):
+    """Decorator that delays a callback until `wait` seconds pass without a new
+    call, so bursts of clicks collapse into one run of the latest call. Calls
+    never overlap: if the previous run is still rendering, the latest call is
+    re-armed rather than run concurrently.
+
+    The callback runs on a timer thread, outside any widget output area, so
+    exceptions it raises are passed to `on_error` (if given) for display.
+    """
+    def decorator(fn):
+        lock = threading.RLock()
+        state = {'timer': None, 'running': False}
+
+        def schedule(args, kwargs):
+            with lock:
+                if state['timer'] is not None:
+                    state['timer'].cancel()  # Drop the stale call
+                state['timer'] = threading.Timer(wait, run, (args, kwargs))
+                state['timer'].start()
+
+        def run(args, kwargs):
+            with lock:
+                if threading.current_thread() is not state['timer']:
+                    return  # Superseded by a newer call
+                if state['running']:
+                    schedule(args, kwargs)  # Still rendering: retry once it has had time to finish
+                    return
+                state['running'] = True
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(e)
+            finally:
+                with lock:
+                    state['running'] = False
+
+        @wraps(fn)
+        def wrapped(*args, **kwargs):
+            schedule(args, kwargs)
+        return wrapped
+    return decorator
+
+
 def interactive_IPMA_visualization(data):
     """
     Creates an interactive IPMA visualization using Plotly and ipywidgets.
@@ -575,28 +1106,44 @@ def interactive_IPMA_visualization(data):
     This version uses the R-based IPMA.
     """
 
+    # --- Session data (converted once; data is treated as immutable while the widget is live) ---
+    numeric_columns = [col for col in data.columns if data[col].dtype in ['int64', 'float64']]
+    data_r = _to_r_dataframe(data, numeric_columns)
+    data_np = {col: data[col].to_numpy() for col in numeric_columns}
+
     # --- Widgets ---
     x_variable_dropdown = widgets.SelectMultiple(
-        options=[col for col in data.columns if data[col].dtype in ['int64', 'float64']],
+        options=numeric_columns,
         description='X Variables:',
         style={'description_width': 'initial'}
     )
 
     y_variable_dropdown = widgets.Dropdown(
-        options=[col for col in data.columns if data[col].dtype in ['int64', 'float64']],
+        options=numeric_columns,
         description='Y Variable:',
         style={'description_width': 'initial'}
     )
 
 
     run_button = widgets.Button(description="Run IPMA (R)")
-    output_area = widgets.Output()  # For displaying results and plots
+    output_area = widgets.Output()  # For displaying results
     bottleneck_table_output = widgets.Output() # For displaying bottleneck table
 
+    # --- Scatter Plot with Ceiling Line (front-end rendered, created once and updated in place) ---
+    ipma_fig = go.FigureWidget(
+        data=[
+            go.Scattergl(mode='markers', marker=dict(color='#00FF00', line=dict(color='#00FFFF', width=0.5)),
+                         name='Data Points'),  # WebGL for the per-row points
+            go.Scatter(mode='lines', line=dict(color='#FF00FF', width=2), name='Ceiling Line'),
+        ]
+    )
+    ipma_fig_box = widgets.Box([ipma_fig], layout=widgets.Layout(display='none'))  # Hidden until there is a plot
+
     # --- Layout ---
     input_widgets = widgets.HBox([x_variable_dropdown, y_variable_dropdown, run_button])
     display(input_widgets)
     display(output_area)
+    display(ipma_fig_box)
     display(bottleneck_table_output)
 
     # --- Event Handler ---
@@ -610,10 +1157,11 @@ def interactive_IPMA_visualization(data):
 
             if not x_vars or not y_var:
                 print("Please select both X and Y variables.")
+                ipma_fig_box.layout.display = 'none'
                 return
 
             # Run IPMA using the R function
-            IPMA_results = run_IPMA_in_r(data, x_vars, y_var)
+            IPMA_results = run_IPMA_in_r(data, x_vars, y_var, return_html=True, r_data=data_r)
 
             # Display Summary
             print(f"IPMA Results (R): {', '.join(x_vars)} vs. {y_var}")
@@ -624,33 +1172,26 @@ def interactive_IPMA_visualization(data):
                     print(f"Effect Size ({x_var}): Not available")
 
             # --- Interactive Scatter Plot with Ceiling Line ---
-            if len(x_vars) == 1:  # Only create the plot if there's a single X variable
+            if len(x_vars) == 1:  # Only show the plot if there's a single X variable
                 x_var = x_vars[0]
-                fig = go.Figure()
-
-                # Scatter plot of data points
-                fig.add_trace(go.Scatter(x=data[x_var], y=data[y_var], mode='markers',
-                                         marker=dict(color='#00FF00', line=dict(color='#00FFFF', width=0.5)),
-                                         name='Data Points'))
-
-                # Ceiling line (if available)
-                if IPMA_results['x_ceiling'] is not None and IPMA_results['y_ceiling'] is not None:
-                    fig.add_trace(go.Scatter(x=IPMA_results['x_ceiling'], y=IPMA_results['y_ceiling'], mode='lines',
-                                             line=dict(color='#FF00FF', width=2),
-                                             name='Ceiling Line'))
-
-                fig.update_layout(
-                    title=f"IPMA (R): {x_var} vs. {y_var}",
-                    xaxis_title=x_var,
-                    yaxis_title=y_var,
-                    plot_bgcolor='#000000',
-                    paper_bgcolor='#000000',
-                    font=dict(color='#00FFFF'),
-                    xaxis=dict(gridcolor='#444444', zerolinecolor='#444444'),
-                    yaxis=dict(gridcolor='#444444')
-                )
-                fig.show()
+                has_ceiling = IPMA_results['x_ceiling'] is not None and IPMA_results['y_ceiling'] is not None
+                with ipma_fig.batch_update():
+                    # Scatter plot of data points
+                    points, ceiling = ipma_fig.data
+                    points.x = data_np[x_var]
+                    points.y = data_np[y_var]
+
+                    # Ceiling line (if available)
+                    ceiling.x = IPMA_results['x_ceiling'] if has_ceiling else None
+                    ceiling.y = IPMA_results['y_ceiling'] if has_ceiling else None
+                    ceiling.visible = has_ceiling
+
+                    ipma_fig.layout.title.text = f"IPMA (R): {x_var} vs. {y_var}"
+                    ipma_fig.layout.xaxis.title.text = x_var
+                    ipma_fig.layout.yaxis.title.text = y_var
+                ipma_fig_box.layout.display = None
             else:
+                ipma_fig_box.layout.display = 'none'
                 print("Scatter plot with ceiling line is only displayed for a single X variable.")
 
 
@@ -658,7 +1199,7 @@ def interactive_IPMA_visualization(data):
             clear_output(wait=True)
             # Display Bottleneck Table (as HTML for better formatting)
             if IPMA_results['bottleneck_table'] is not None:
-                display(HTML(IPMA_results['bottleneck_table'].to_html(classes='bottleneck-table')))
+                display(HTML(IPMA_results['bottleneck_table']))
             else:
                 print("Bottleneck table not available.")
 
@@ -676,7 +1217,7 @@ def interactive_sem_visualization(data):
 
     # --- Widgets ---
     variable_selector = widgets.SelectMultiple(
-        options=data.columns.tolist(),
+        options=tuple(data.columns),
         description='Select Variables:',
         style={'description_width': 'initial'}
     )
@@ -693,18 +1234,27 @@ def interactive_sem_visualization(data):
     run_sem_button = widgets.Button(description="Run SEM & IPMA")
     output_area = widgets.Output()
 
+    # --- IPMA Plot (front-end rendered, created once and updated in place) ---
+    sem_ipma_fig = go.FigureWidget(
+        data=[go.Scattergl(mode='markers', marker=dict(color='#00FFFF', line=dict(color='#00FFFF', width=0.5)))],  # WebGL
+        layout=go.Layout(title="IPMA: Total Effect vs. Importance", xaxis_title="total", yaxis_title="importance",
+                         template='neon')
+    )
+    sem_ipma_fig_box = widgets.Box([sem_ipma_fig], layout=widgets.Layout(display='none'))  # Hidden until there is a plot
+
     # --- Layout ---
-    display(widgets.VBox([variable_selector, model_specification_text, run_sem_button, output_area]))
+    display(widgets.VBox([variable_selector, model_specification_text, run_sem_button, output_area, sem_ipma_fig_box]))
 
     # --- Event Handlers ---
     def run_sem_ipma(button):
         """Runs SEM and IPMA based on user selections."""
         with output_area:
             clear_output(wait=True)
+            sem_ipma_fig_box.layout.display = 'none'
             selected_vars = list(variable_selector.value)
             model_spec = model_specification_text.value
 
-if not selected_vars or not model_spec.strip():  # Check for empty string after removing whitespace
+            if not selected_vars or not model_spec.strip():  # Check for empty string after removing whitespace
                 print("Please select variables and provide a valid model specification.")
                 return
 
@@ -728,12 +1278,10 @@ if not selected_vars or not model_spec.strip():  # Check for empty string after
                 #  This is a basic example; adapt it to your specific needs.
                 if isinstance(sem_ipma_results, pd.DataFrame): # Check if results are a DataFrame
                     try:
-                        fig = px.scatter(sem_ipma_results, x="total", y="importance",
-                                        color_discrete_sequence=['#00FFFF'],
-                                        title="IPMA: Total Effect vs. Importance")
-                        fig.update_traces(marker=dict(line=dict(color='#00FFFF', width=0.5)))
-                        fig.update_layout(plot_bgcolor='#000000', paper_bgcolor='#000000', font=dict(color='#00FFFF'))
-                        fig.show()
+                        with sem_ipma_fig.batch_update():
+                            sem_ipma_fig.data[0].x = sem_ipma_results["total"].to_numpy()
+                            sem_ipma_fig.data[0].y = sem_ipma_results["importance"].to_numpy()
+                        sem_ipma_fig_box.layout.display = None
                     except Exception as e:
                         print(f"Error creating IPMA plot: {e}")
                 else:
@@ -752,101 +1300,169 @@ def interactive_data_exploration(data):
     """
     Provides interactive widgets for general data exploration (histograms, violin plots, etc.).
     """
+    # --- Session data (columns and their numpy arrays, extracted once; tuples are shared as dropdown options) ---
+    cols = tuple(data.columns)
+    numeric_cols = tuple(data.select_dtypes(include='number').columns)
+    arrs = {col: data[col].to_numpy() for col in cols}
+    # Plot types whose X axis must be numeric (the others group by X)
+    numeric_x_plots = {'Histogram', 'Scatter Plot', 'KDE Plot (2D)'}
+
     # --- Widgets ---
     plot_type = widgets.Dropdown(
-        options=['Histogram', 'Violin Plot', 'Scatter Plot', 'Box Plot', 'KDE Plot (2D)'],
+        options=('Histogram', 'Violin Plot', 'Scatter Plot', 'Box Plot', 'KDE Plot (2D)'),
         value='Histogram',
         description='Plot Type:',
         style={'description_width': 'initial'}
     )
 
     x_variable = widgets.Dropdown(
-        options=data.columns.tolist(),
+        options=numeric_cols,  # Histogram is the initial plot type
         description='X Variable:',
         style={'description_width': 'initial'}
     )
 
     y_variable = widgets.Dropdown(
-        options=['None'] + data.columns.tolist(),  # Allow "None" for univariate plots
+        options=('None', *numeric_cols),  # Allow "None" for univariate plots; Y is always a numeric measure
         value='None',
         description='Y Variable:',
         style={'description_width': 'initial'}
     )
 
     group_variable = widgets.Dropdown( # for stacked bar plots and grouped plots
-        options = ['None'] + data.columns.tolist(),
+        options = ('None', *cols),
         value = 'None',
         description = 'Group by (for stacked/grouped plots):',
         style={'description_width': 'initial'}
     )
 
     plot_button = widgets.Button(description="Generate Plot")
-    output_area = widgets.Output()
+    status_label = widgets.Label()  # For validation messages
+
+    # --- Figure (created once and updated in place on every click) ---
+    # Wrapped with plotly-resampler so large scatter traces are aggregated to the visible window
+    fig = FigureWidgetResampler(go.FigureWidget(), default_n_shown_samples=2000)
+
+    # Trace type and styling per plot choice
+    trace_specs = {
+        'Histogram': (go.Bar, dict(marker=dict(color='#00FFFF', line=dict(color='#00FFFF', width=0.5)))),  # Binned in numpy
+        'Violin Plot': (go.Scatter, dict(mode='lines', fill='toself', fillcolor='rgba(0,0,0,0)', hoveron='fills',
+                                         line=dict(color='#00FFFF'), showlegend=False)),  # Outline from precomputed KDEs
+        'Scatter Plot': (go.Scattergl, dict(mode='markers', marker=dict(color='#00FFFF', line=dict(color='#00FFFF', width=0.5)))),  # WebGL
+        'Box Plot': (go.Box, dict(line=dict(color='#00FFFF'))),
+        'KDE Plot (2D)': (go.Contour, dict(contours_coloring="lines", line=dict(width=2), showscale=False,
+                                            colorscale=[[0, '#00FFFF'], [1, '#00FFFF']])), # Contour lines only
+    }
+    plot_titles = {
+        'Histogram': "Histogram of {x}",
+        'Violin Plot': "Violin Plot of {y} by {x}",
+        'Scatter Plot': "Scatter Plot of {x} vs. {y}",
+        'Box Plot': "Box Plot of {y} by {x}",
+        'KDE Plot (2D)': "KDE Plot of {x} vs. {y}",
+    }
 
     # --- Layout ---
-    display(widgets.VBox([plot_type, x_variable, y_variable, group_variable, plot_button, output_area]))
+    display(widgets.VBox([plot_type, x_variable, y_variable, group_variable, plot_button, status_label, fig]))
 
     # --- Event Handlers ---
+    def update_variable_options(change):
+        """Narrows the X options to numeric columns for plot types that need them."""
+        x_variable.options = numeric_cols if change['new'] in numeric_x_plots else cols
+
+    @lru_cache(maxsize=16)
+    def build_plot_spec(plot_choice, x_var, y_var, group_var):
+        """
+        Builds the trace and layout spec for a selection.  Memoized, so flipping back to a
+        recent selection skips the recomputation (`data` is not modified during the session).
+        """
+        trace_type, trace_style = trace_specs[plot_choice]
+        xaxis = dict(title=dict(text=x_var), tickmode=None, tickvals=None, ticktext=None)
+        if plot_choice == 'Violin Plot':
+            # Per-group KDEs evaluated in Python (cached); each violin is sent as one closed outline
+            densities = _violin_densities(data, x_var, y_var)
+            max_density = max((kde[1].max() for _, kde in densities if kde is not None), default=1.0)
+            traces_values = []
+            for position, (group, kde) in enumerate(densities):
+                if kde is None:  # Constant (or empty) group: mark its value
+                    values = data.loc[data[x_var] == group, y_var].dropna()
+                    if not values.empty:
+                        value = values.iloc[0]
+                        traces_values.append(dict(x=[position - 0.4, position + 0.4], y=[value, value],
+                                                  fill=None, name=str(group)))
+                    continue
+                grid, density = kde
+                half_width = 0.4 * density / max_density
+                traces_values.append(dict(x=np.concatenate([position - half_width, (position + half_width)[::-1]]),
+                                          y=np.concatenate([grid, grid[::-1]]), name=str(group)))
+            xaxis.update(tickmode='array', tickvals=list(range(len(densities))),
+                         ticktext=[str(group) for group, _ in densities])
+        elif plot_choice == 'KDE Plot (2D)':
+            # Evaluate the density grid in Python and send only the grid to the browser
+            X, Y, Z = _kde_2d_grid(data, x_var, y_var)
+            traces_values = [dict(x=X[0], y=Y[:, 0], z=Z)]
+        elif plot_choice == 'Histogram':
+            # Bin in numpy and send only the bar heights instead of every sample
+            values = data[x_var].dropna().to_numpy()  # Keeps integer dtype, so 'auto' bins stay at least 1 wide
+            counts, edges = np.histogram(values[np.isfinite(values)], bins='auto')  # Skip NaN/inf like plotly does
+            traces_values = [dict(x=0.5 * (edges[:-1] + edges[1:]), y=counts, width=np.diff(edges))]
+        elif plot_choice == 'Scatter Plot':
+            x, y = arrs[x_var], arrs[y_var]
+            present = pd.notna(x) & pd.notna(y)  # Missing points are not drawn, and NaN x cannot be sorted
+            x, y = x[present], y[present]
+            order = np.argsort(x, kind='stable')  # plotly-resampler requires sorted x
+            traces_values = [dict(x=x[order], y=y[order])]
+        else:
+            traces_values = [dict(x=arrs[x_var], y=arrs[y_var] if y_var else None)]
+
+        layout = dict(title=dict(text=plot_titles[plot_choice].format(x=x_var, y=y_var)),
+                      xaxis=xaxis,  # Tick overrides are cleared for the non-violin plots
+                      yaxis=dict(title=dict(text=y_var if y_var else 'count')))
+        return {'data': [trace_type(**{**trace_style, **values}).to_plotly_json() for values in traces_values],
+                'layout': layout}
+
+    def clear_plot():
+        """Removes the previous plot's traces (and plotly-resampler's copies of them) and titles."""
+        with fig.batch_update():
+            fig.data = ()
+            fig._hf_data.clear()  # Drop plotly-resampler's full-resolution copies of the removed traces
+            fig.layout.update(title_text=None, xaxis_title_text=None, yaxis_title_text=None)
+
+    def show_plot_error(error):
+        """Reports a failed render in the status label (generate_plot runs off the main thread)."""
+        clear_plot()
+        status_label.value = f"Error creating {plot_type.value}: {error}"
+
+    @debounce(0.15, on_error=show_plot_error)
     def generate_plot(button):
-        with output_area:
-            clear_output(wait=True)
-            plot_choice = plot_type.value
-            x_var = x_variable.value
-            y_var = y_variable.value if y_variable.value != 'None' else None
-            group_var = group_variable.value if group_variable.value != 'None' else None
-
-            if plot_choice == 'Histogram':
-                fig = px.histogram(data, x=x_var, color_discrete_sequence=['#00FFFF'],
-                                   title=f"Histogram of {x_var}")
-                fig.update_traces(marker=dict(line=dict(color='#00FFFF', width=0.5)))
-                fig.update_layout(plot_bgcolor='#000000', paper_bgcolor='#000000', font=dict(color='#00FFFF'))
-                fig.show()
-
-            elif plot_choice == 'Violin Plot':
-                if y_var:
-                    fig = px.violin(data, x=x_var, y=y_var, color_discrete_sequence=['#00FFFF'],
-                                    title=f"Violin Plot of {y_var} by {x_var}")
-                    fig.update_traces(line=dict(color='#00FFFF')) # No fill, just outline
-                    fig.update_layout(plot_bgcolor='#000000', paper_bgcolor='#000000', font=dict(color='#00FFFF'))
-                    fig.show()
-                else:
-                    print("Please select a Y variable for the Violin Plot.")
-
-            elif plot_choice == 'Scatter Plot':
-                if y_var:
-                    fig = px.scatter(data, x=x_var, y=y_var, color_discrete_sequence=['#00FFFF'],
-                                     title=f"Scatter Plot of {x_var} vs. {y_var}")
-                    fig.update_traces(marker=dict(line=dict(color='#00FFFF', width=0.5)))
-                    fig.update_layout(plot_bgcolor='#000000', paper_bgcolor='#000000', font=dict(color='#00FFFF'))
-                    fig.show()
-                else:
-                    print("Please select a Y variable for the Scatter Plot.")
-
-            elif plot_choice == 'Box Plot':
-                if y_var:
-                    fig = px.box(data, x=x_var, y=y_var, color_discrete_sequence=['#00FFFF'],
-                                 title=f"Box Plot of {y_var} by {x_var}")
-                    fig.update_traces(line=dict(color='#00FFFF'))
-                    fig.update_layout(plot_bgcolor='#000000', paper_bgcolor='#000000', font=dict(color='#00FFFF'))
-                    fig.show()
-                else:
-                    print("Please select a Y variable for the Box Plot")
+        plot_choice = plot_type.value
+        x_var = x_variable.value
+        y_var = y_variable.value if y_variable.value != 'None' else None
+        group_var = group_variable.value if group_variable.value != 'None' else None
 
-            elif plot_choice == 'KDE Plot (2D)':
-                if y_var:
-                    try:
-                        fig = px.density_contour(data, x=x_var, y=y_var,
-                                                 color_discrete_sequence=['#00FFFF'],
-                                                 title=f"KDE Plot of {x_var} vs. {y_var}")
-                        fig.update_traces(contours_coloring="lines", line_width=2) # Contour lines only
-                        fig.update_layout(plot_bgcolor='#000000', paper_bgcolor='#000000', font=dict(color='#00FFFF'))
-                        fig.show()
-                    except ValueError as e:
-                        print(f"Error creating KDE Plot: {e}.  Check if the selected variables are suitable for a 2D KDE.")
-                else:
-                    print("Please select a Y variable for the KDE Plot.")
+        if plot_choice != 'Histogram' and not y_var:
+            clear_plot()
+            status_label.value = f"Please select a Y variable for the {plot_choice}."
+            return
+        status_label.value = ''
 
-    # --- Attach Event Handler ---
+        try:
+            spec = build_plot_spec(plot_choice, x_var, y_var, group_var)
+        except np.linalg.LinAlgError as e:  # Only raised by the KDE grid; failures are not cached
+            clear_plot()
+            status_label.value = f"Error creating KDE Plot: {e}.  The selected variables are perfectly correlated or constant."
+            return
+
+        with fig.batch_update():
+            clear_plot()
+            if plot_choice == 'Scatter Plot':
+                # Hand the full data to plotly-resampler, which sends only the visible aggregate
+                trace = dict(spec['data'][0])
+                fig.add_trace(trace, hf_x=trace.pop('x'), hf_y=trace.pop('y'))
+            else:
+                fig.add_traces(spec['data'])
+            fig.layout.update(spec['layout'])
+
+    # --- Attach Event Handlers ---
+    plot_type.observe(update_variable_options, names='value')
     plot_button.on_click(generate_plot)
 
 
@@ -854,8 +1470,9 @@ def interactive_data_exploration(data):
 
 if __name__ == '__main__':
     apply_minimalist_neon_theme()  # Apply the theme
-    data = simulate_data()  # Generate the data
-    processed_data = preprocess_data(data) #preprocess
+    # Generate and preprocess the data, reusing the cached copies while the functions are unchanged
+    data = load_or_build_parquet('data', simulate_data, simulate_data)
+    processed_data = load_or_build_parquet('processed_data', lambda: preprocess_data(data), simulate_data, preprocess_data)
 
     # --- Basic Statistical Analysis and Plotting ---
     descriptive_stats, correlation_matrix, group_comparison_results = perform_statistical_analysis(data)
@@ -863,23 +1480,37 @@ if __name__ == '__main__':
     # Save descriptive stats to HTML
     generate_summary_html(data, filename=os.path.join(output_dir, "summary_statistics.html"))
 
-    # --- Create and save plots (REVISED PLOT LIST) ---
+    # --- Create and save plots (REVISED PLOT LIST, rendered in parallel) ---
 
-    # Violin Plots
-    create_violin_plot_mpl(data, 'LLMUsage', 'CompletionTime', os.path.join(output_dir, 'llm_completion_violin.png'))
-    create_violin_plot_mpl(data, 'LLMUsage', 'ErrorsIdentified', os.path.join(output_dir, 'llm_errors_violin.png'))
-    create_violin_plot_mpl(data, 'HerbalBlend', 'CompletionTime', os.path.join(output_dir, 'herbal_completion_violin.png'))
-    create_violin_plot_mpl(data, 'HerbalBlend', 'ErrorsIdentified', os.path.join(output_dir, 'herbal_errors_violin.png'))
-    create_violin_plot_mpl(data, 'LLMUsage', 'FinalSelfEfficacy', os.path.join(output_dir, 'llm_selfefficacy_violin.png'))
-    create_violin_plot_mpl(data, 'HerbalBlend', 'FinalAnxiety', os.path.join(output_dir, 'herbal_anxiety_violin.png'))
+    # Violin Plots (x column, y column), drawn as panels of a single figure
+    violin_specs = [
+        ('LLMUsage', 'CompletionTime'),
+        ('LLMUsage', 'ErrorsIdentified'),
+        ('HerbalBlend', 'CompletionTime'),
+        ('HerbalBlend', 'ErrorsIdentified'),
+        ('LLMUsage', 'FinalSelfEfficacy'),
+        ('HerbalBlend', 'FinalAnxiety'),
+    ]
+    violin_columns = list(dict.fromkeys(col for spec in violin_specs for col in spec))
+
+    # Stacked Bar Plots (x column, y column, color column, filename)
+    stacked_bar_specs = [
+        ('ProgrammingExperience', 'CompletionTime', 'LLMUsage', 'experience_completion_llm_stackedbar.png'),
+        ('ProgrammingExperience', 'ErrorsIdentified', 'LLMUsage', 'experience_errors_llm_stackedbar.png'),
+        ('ProgrammingExperience', 'FinalSelfEfficacy', 'LLMUsage', 'experience_selfefficacy_llm_stackedbar.png'),
+        ('ProgrammingExperience', 'FinalAnxiety', 'LLMUsage', 'experience_anxiety_llm_stackedbar.png'),
+        ('Gender', 'CompletionTime', 'HerbalBlend', 'gender_completion_herbal_stackedbar.png'),
+        ('Gender', 'ErrorsIdentified', 'HerbalBlend', 'gender_errors_herbal_stackedbar.png'),
+    ]
 
-    # Stacked Bar Plots
-    create_stacked_bar_plot_mpl(data, 'ProgrammingExperience', 'CompletionTime', 'LLMUsage', os.path.join(output_dir, 'experience_completion_llm_stackedbar.png'))
-    create_stacked_bar_plot_mpl(data, 'ProgrammingExperience', 'ErrorsIdentified', 'LLMUsage', os.path.join(output_dir, 'experience_errors_llm_stackedbar.png'))
-    create_stacked_bar_plot_mpl(data, 'ProgrammingExperience', 'FinalSelfEfficacy', 'LLMUsage', os.path.join(output_dir, 'experience_selfefficacy_llm_stackedbar.png'))
-    create_stacked_bar_plot_mpl(data, 'ProgrammingExperience', 'FinalAnxiety', 'LLMUsage', os.path.join(output_dir, 'experience_anxiety_llm_stackedbar.png'))
-    create_stacked_bar_plot_mpl(data, 'Gender', 'CompletionTime', 'HerbalBlend', os.path.join(output_dir, 'gender_completion_herbal_stackedbar.png'))
-    create_stacked_bar_plot_mpl(data, 'Gender', 'ErrorsIdentified', 'HerbalBlend', os.path.join(output_dir, 'gender_errors_herbal_stackedbar.png'))
+    # Each job receives only the columns it plots
+    plot_jobs = [
+        (create_violin_grid_mpl, (data[violin_columns], violin_specs, os.path.join(output_dir, 'violins_grid.png')))
+    ] + [
+        (create_stacked_bar_plot_mpl, (data[[x, y, color]], x, y, color, os.path.join(output_dir, filename)))
+        for x, y, color, filename in stacked_bar_specs
+    ]
+    export_plots_parallel(plot_jobs)
 
 
     # --- SEM Diagrams (Conceptual) ---
@@ -902,22 +1533,25 @@ if __name__ == '__main__':
     ]
     create_sem_diagram_mpl("Basic Model", nodes_basic, edges_basic, os.path.join(output_dir, 'sem_diagram_basic.png'))
 
-    # --- Regression Analysis ---
-    regression_results = perform_regression_analysis(processed_data, 'Performance')
-    print("\nRegression Results (Performance):\n", regression_results.summary())
+    # --- Regression and Qualitative Analyses (run in worker threads while the widgets are set up) ---
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        regression_future = executor.submit(perform_regression_analysis, processed_data, 'Performance')
+        # Both qualitative analyses draw from the global NumPy RNG, so they share one thread to keep the draw order
+        qualitative_future = executor.submit(lambda: (analyze_prompts(data), analyze_interviews(data)))
+
+        # --- Interactive Visualizations ---
+        print("\nInteractive IPMA Visualization (R):")
+        interactive_IPMA_visualization(data)
 
-    # --- Qualitative Analyses ---
-    prompt_analysis_results = analyze_prompts(data)
-    print("\nPrompt Analysis:\n", prompt_analysis_results)
-    interview_analysis_results = analyze_interviews(data)
-    print("\nInterview Analysis:\n", interview_analysis_results)
+        print("\nInteractive SEM Visualization:")
+        interactive_sem_visualization(processed_data)
 
-    # --- Interactive Visualizations ---
-    print("\nInteractive IPMA Visualization (R):")
-    interactive_IPMA_visualization(data)
+        print("\nInteractive Data Exploration:")
+        interactive_data_exploration(data)
 
-    print("\nInteractive SEM Visualization:")
-    interactive_sem_visualization(processed_data)
+        regression_results = regression_future.result()
+        print("\nRegression Results (Performance):\n", regression_results.summary())
 
-    print("\nInteractive Data Exploration:")
-    interactive_data_exploration(data)
+        prompt_analysis_results, interview_analysis_results = qualitative_future.result()
+        print("\nPrompt Analysis:\n", prompt_analysis_results)
+        print("\nInterview Analysis:\n", interview_analysis_results)